@@ -1,6 +1,142 @@
 """Architecture planning module for code generation."""
 from typing import Dict, List
 
+_BASE_STRUCTURES = {
+    "nodejs-express": {
+        "directories": [
+            "src",
+            "src/routes",
+            "src/controllers",
+            "src/middleware",
+            "src/models",
+            "src/utils",
+            "tests",
+            "tests/unit",
+            "tests/integration",
+        ],
+        "files": [
+            "src/server.js",
+            "src/app.js",
+            "src/routes/index.js",
+            "src/controllers/healthController.js",
+            "src/middleware/errorHandler.js",
+            "src/utils/logger.js",
+            "tests/unit/health.test.js",
+            "tests/integration/api.test.js",
+            "package.json",
+            ".eslintrc.json",
+            ".gitignore",
+            ".env.example",
+            "README.md",
+            "LICENSE",
+        ],
+    },
+    "python-fastapi": {
+        "directories": [
+            "src",
+            "src/api",
+            "src/api/routes",
+            "src/models",
+            "src/services",
+            "src/core",
+            "tests",
+            "tests/unit",
+            "tests/integration",
+        ],
+        "files": [
+            "src/main.py",
+            "src/api/routes/health.py",
+            "src/core/config.py",
+            "src/core/security.py",
+            "tests/test_health.py",
+            "tests/conftest.py",
+            "requirements.txt",
+            "pytest.ini",
+            ".gitignore",
+            ".env.example",
+            "README.md",
+            "LICENSE",
+        ],
+    },
+    "react-typescript": {
+        "directories": [
+            "src",
+            "src/components",
+            "src/hooks",
+            "src/utils",
+            "src/types",
+            "src/styles",
+            "public",
+            "tests",
+        ],
+        "files": [
+            "src/main.tsx",
+            "src/App.tsx",
+            "src/components/Header.tsx",
+            "src/vite-env.d.ts",
+            "index.html",
+            "package.json",
+            "tsconfig.json",
+            "vite.config.ts",
+            ".eslintrc.json",
+            ".gitignore",
+            "README.md",
+            "LICENSE",
+        ],
+    },
+    "python-cli": {
+        "directories": ["src", "src/commands", "src/utils", "tests"],
+        "files": [
+            "src/cli.py",
+            "src/__init__.py",
+            "src/commands/__init__.py",
+            "src/commands/main.py",
+            "tests/test_cli.py",
+            "requirements.txt",
+            "setup.py",
+            "pytest.ini",
+            ".gitignore",
+            "README.md",
+            "LICENSE",
+        ],
+    },
+    "go-cli": {
+        "directories": ["cmd", "pkg", "internal", "tests"],
+        "files": [
+            "main.go",
+            "cmd/root.go",
+            "go.mod",
+            ".gitignore",
+            "README.md",
+            "LICENSE",
+        ],
+    },
+    "python-ml": {
+        "directories": [
+            "src",
+            "src/data",
+            "src/models",
+            "src/features",
+            "notebooks",
+            "tests",
+            "data",
+            "data/raw",
+            "data/processed",
+        ],
+        "files": [
+            "src/model.py",
+            "src/train.py",
+            "src/predict.py",
+            "notebooks/exploration.ipynb",
+            "tests/test_model.py",
+            "requirements.txt",
+            ".gitignore",
+            "README.md",
+            "LICENSE",
+        ],
+    },
+}
+
 
 class ArchitecturePlanner:
     """Plans project architecture and file structure."""
@@ -19,145 +155,8 @@ class ArchitecturePlanner:
         Returns:
             Dict containing architecture plan
         """
-        base_structures = {
-            "nodejs-express": {
-                "directories": [
-                    "src",
-                    "src/routes",
-                    "src/controllers",
-                    "src/middleware",
-                    "src/models",
-                    "src/utils",
-                    "tests",
-                    "tests/unit",
-                    "tests/integration",
-                ],
-                "files": [
-                    "src/server.js",
-                    "src/app.js",
-                    "src/routes/index.js",
-                    "src/controllers/healthController.js",
-                    "src/middleware/errorHandler.js",
-                    "src/utils/logger.js",
-                    "tests/unit/health.test.js",
-                    "tests/integration/api.test.js",
-                    "package.json",
-                    ".eslintrc.json",
-                    ".gitignore",
-                    ".env.example",
-                    "README.md",
-                    "LICENSE",
-                ],
-            },
-            "python-fastapi": {
-                "directories": [
-                    "src",
-                    "src/api",
-                    "src/api/routes",
-                    "src/models",
-                    "src/services",
-                    "src/core",
-                    "tests",
-                    "tests/unit",
-                    "tests/integration",
-                ],
-                "files": [
-                    "src/main.py",
-                    "src/api/routes/health.py",
-                    "src/core/config.py",
-                    "src/core/security.py",
-                    "tests/test_health.py",
-                    "tests/conftest.py",
-                    "requirements.txt",
-                    "pytest.ini",
-                    ".gitignore",
-                    ".env.example",
-                    "README.md",
-                    "LICENSE",
-                ],
-            },
-            "react-typescript": {
-                "directories": [
-                    "src",
-                    "src/components",
-                    "src/hooks",
-                    "src/utils",
-                    "src/types",
-                    "src/styles",
-                    "public",
-                    "tests",
-                ],
-                "files": [
-                    "src/main.tsx",
-                    "src/App.tsx",
-                    "src/components/Header.tsx",
-                    "src/vite-env.d.ts",
-                    "index.html",
-                    "package.json",
-                    "tsconfig.json",
-                    "vite.config.ts",
-                    ".eslintrc.json",
-                    ".gitignore",
-                    "README.md",
-                    "LICENSE",
-                ],
-            },
-            "python-cli": {
-                "directories": ["src", "src/commands", "src/utils", "tests"],
-                "files": [
-                    "src/cli.py",
-                    "src/__init__.py",
-                    "src/commands/__init__.py",
-                    "src/commands/main.py",
-                    "tests/test_cli.py",
-                    "requirements.txt",
-                    "setup.py",
-                    "pytest.ini",
-                    ".gitignore",
-                    "README.md",
-                    "LICENSE",
-                ],
-            },
-            "go-cli": {
-                "directories": ["cmd", "pkg", "internal", "tests"],
-                "files": [
-                    "main.go",
-                    "cmd/root.go",
-                    "go.mod",
-                    ".gitignore",
-                    "README.md",
-                    "LICENSE",
-                ],
-            },
-            "python-ml": {
-                "directories": [
-                    "src",
-                    "src/data",
-                    "src/models",
-                    "src/features",
-                    "notebooks",
-                    "tests",
-                    "data",
-                    "data/raw",
-                    "data/processed",
-                ],
-                "files": [
-                    "src/model.py",
-                    "src/train.py",
-                    "src/predict.py",
-                    "notebooks/exploration.ipynb",
-                    "tests/test_model.py",
-                    "requirements.txt",
-                    ".gitignore",
-                    "README.md",
-                    "LICENSE",
-                ],
-            },
-        }
-
-        structure = base_structures.get(
-            stack_id, base_structures["nodejs-express"]
-        ).copy()
+        base = _BASE_STRUCTURES.get(stack_id, _BASE_STRUCTURES["nodejs-express"])
+        structure = {key: list(value) for key, value in base.items()}
 
         structure["workflow_file"] = ".github/workflows/ci.yml"
         structure["directories"].append(".github")
@@ -1,9 +1,17 @@
 """Code generation engine."""
+import json
 import os
-from typing import Dict, List
+from typing import Any, Dict, List, Mapping
 from jinja2 import Environment, FileSystemLoader, Template
 
 
+def _json_default(obj: Any) -> Dict:
+    """Serialize read-only mappings such as MappingProxyType as plain dicts."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class CodeGenerator:
     """Generates production-ready code from templates."""
 
@@ -875,6 +883,4 @@ jobs:
 
     def _json_dumps(self, obj: Dict) -> str:
         """Convert dict to formatted JSON string."""
-        import json
-
-        return json.dumps(obj, indent=2)
+        return json.dumps(obj, indent=2, default=_json_default)
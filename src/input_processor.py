@@ -2,6 +2,10 @@
 from typing import Dict, List, Optional
 import re
 
+_INVALID_NAME_CHARS_RE = re.compile(r"[^a-zA-Z0-9-_.]")
+_REPEATED_HYPHENS_RE = re.compile(r"-+")
+_VALID_NAME_RE = re.compile(r"^[a-zA-Z0-9-_.]+$")
+
 
 class InputProcessor:
     """Processes and validates user input for code generation."""
@@ -62,8 +66,8 @@ class InputProcessor:
 
     def _sanitize_repo_name(self, name: str) -> str:
         """Sanitize repository name to meet GitHub requirements."""
-        name = re.sub(r"[^a-zA-Z0-9-_.]", "-", name)
-        name = re.sub(r"-+", "-", name)
+        name = _INVALID_NAME_CHARS_RE.sub("-", name)
+        name = _REPEATED_HYPHENS_RE.sub("-", name)
         name = name.strip("-._")
         return name[:100] if name else "generated-project"
 
@@ -73,7 +77,7 @@ class InputProcessor:
             raise ValueError("Repository name cannot be empty")
         if len(name) > 100:
             raise ValueError("Repository name must be 100 characters or less")
-        if not re.match(r"^[a-zA-Z0-9-_.]+$", name):
+        if not _VALID_NAME_RE.match(name):
             raise ValueError(
                 "Repository name can only contain alphanumeric characters, hyphens, underscores, and periods"
             )
@@ -1,20 +1,131 @@
 """Quality assurance module for generated code."""
 import re
 import ast
-from typing import Dict, List, Tuple
+import json
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+
+_SECURITY_RULES = (
+    (r"password\s*=\s*['\"][^'\"]+['\"]", "Hardcoded password detected"),
+    (r"api[_-]?key\s*=\s*['\"][^'\"]+['\"]", "Hardcoded API key detected"),
+    (r"secret\s*=\s*['\"][^'\"]+['\"]", "Hardcoded secret detected"),
+    (r"token\s*=\s*['\"][^'\"]+['\"]", "Hardcoded token detected"),
+)
+_SECURITY_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), message)
+    for pattern, message in _SECURITY_RULES
+)
+# Combined pre-check: it finds nothing exactly when no single rule matches.
+# The per-rule scans still run afterwards, because one alternation only
+# yields non-overlapping matches and would hide a secret nested in another.
+_SECURITY_RE = re.compile(
+    "|".join(pattern for pattern, _ in _SECURITY_RULES),
+    re.IGNORECASE,
+)
+# Literals at least one of which every security rule requires. Matched with
+# the rules' Unicode IGNORECASE folding, which str.lower() does not replicate.
+_SECURITY_LITERALS_RE = re.compile("password|api|secret|token", re.IGNORECASE)
+_README_REQUIRED_SECTIONS = ("Setup", "Requirements")
+_README_SECTIONS_RE = re.compile(
+    "|".join(f"(?P<{section}>{section})" for section in _README_REQUIRED_SECTIONS),
+    re.IGNORECASE | re.ASCII,
+)
+_SOURCE_EXTENSIONS = (".py", ".js", ".ts", ".go")
+_SECURITY_SKIP_FILES = frozenset(
+    {
+        ".env.example",
+        "README.md",
+        "LICENSE",
+        "package-lock.json",
+        "yarn.lock",
+        "poetry.lock",
+    }
+)
+# Files above this size or with a NUL in the first _BINARY_SNIFF_CHARS are
+# treated as minified/binary and skipped unless a deep scan is requested.
+_SECURITY_MAX_SCAN_CHARS = 1 << 20
+_BINARY_SNIFF_CHARS = 4096
+_PLACEHOLDERS = ("TODO", "FIXME", "PLACEHOLDER", "YOUR_", "CHANGE_ME")
+_PLACEHOLDER_RE = re.compile("|".join(map(re.escape, _PLACEHOLDERS)))
+_PLACEHOLDER_SKIP_FILES = frozenset({".env.example", "README.md"})
+# Contents longer than this are checked without going through the
+# per-content caches, so large files are never held in memory by them.
+_MAX_CACHED_CONTENT_CHARS = 1 << 20
+_REQUIRED_FILES = MappingProxyType(
+    {
+        "nodejs-express": ("package.json", "README.md", ".gitignore"),
+        "python-fastapi": ("requirements.txt", "README.md", ".gitignore"),
+        "react-typescript": ("package.json", "tsconfig.json", "README.md"),
+        "python-cli": ("requirements.txt", "setup.py", "README.md"),
+        "go-cli": ("go.mod", "main.go", "README.md"),
+        "python-ml": ("requirements.txt", "README.md", ".gitignore"),
+    }
+)
+
+
+def _scan_python_syntax(content: str) -> Optional[str]:
+    """Return the syntax error for Python source, or None if it parses."""
+    if not content.strip():
+        return None
+    try:
+        ast.parse(content)
+    except SyntaxError as e:
+        return str(e)
+    return None
+
+
+_cached_scan_python_syntax = lru_cache(maxsize=256)(_scan_python_syntax)
+
+
+def _python_syntax_error(content: str) -> Optional[str]:
+    """Parse Python source, caching only contents up to the cache limit."""
+    if len(content) > _MAX_CACHED_CONTENT_CHARS:
+        return _scan_python_syntax(content)
+    return _cached_scan_python_syntax(content)
+
+
+def _scan_security(content: str) -> Tuple[str, ...]:
+    """Return the security issue messages for one file's content."""
+    if not _SECURITY_LITERALS_RE.search(content):
+        return ()
+    if not _SECURITY_RE.search(content):
+        return ()
+    return tuple(
+        message
+        for pattern, message in _SECURITY_PATTERNS
+        for match in pattern.finditer(content)
+        if "example" not in match.group().lower()
+    )
+
+
+def _scan_placeholders(content: str) -> Tuple[str, ...]:
+    """Return the placeholders present in content, in _PLACEHOLDERS order."""
+    found = set(_PLACEHOLDER_RE.findall(content))
+    return tuple(placeholder for placeholder in _PLACEHOLDERS if placeholder in found)
+
+
+_cached_scan_security = lru_cache(maxsize=256)(_scan_security)
+_cached_scan_placeholders = lru_cache(maxsize=256)(_scan_placeholders)
+
+
+def _security_messages(content: str) -> Tuple[str, ...]:
+    """Scan content for secrets, caching only contents up to the cache limit."""
+    if len(content) > _MAX_CACHED_CONTENT_CHARS:
+        return _scan_security(content)
+    return _cached_scan_security(content)
+
+
+def _placeholders_found(content: str) -> Tuple[str, ...]:
+    """Scan content for placeholders, caching only contents up to the cache limit."""
+    if len(content) > _MAX_CACHED_CONTENT_CHARS:
+        return _scan_placeholders(content)
+    return _cached_scan_placeholders(content)
 
 
 class QualityAssurance:
     """Validates generated code quality."""
 
-    def __init__(self):
-        self.security_patterns = [
-            (r"password\s*=\s*['\"][^'\"]+['\"]", "Hardcoded password detected"),
-            (r"api[_-]?key\s*=\s*['\"][^'\"]+['\"]", "Hardcoded API key detected"),
-            (r"secret\s*=\s*['\"][^'\"]+['\"]", "Hardcoded secret detected"),
-            (r"token\s*=\s*['\"][^'\"]+['\"]", "Hardcoded token detected"),
-        ]
-
     def validate_project(self, files: Dict[str, str], stack_id: str) -> Tuple[bool, List[str]]:
         """
         Validate entire project.
@@ -44,16 +155,7 @@ class QualityAssurance:
 
     def _check_required_files(self, files: Dict[str, str], stack_id: str) -> bool:
         """Check if all required files are present."""
-        required_files = {
-            "nodejs-express": ["package.json", "README.md", ".gitignore"],
-            "python-fastapi": ["requirements.txt", "README.md", ".gitignore"],
-            "react-typescript": ["package.json", "tsconfig.json", "README.md"],
-            "python-cli": ["requirements.txt", "setup.py", "README.md"],
-            "go-cli": ["go.mod", "main.go", "README.md"],
-            "python-ml": ["requirements.txt", "README.md", ".gitignore"],
-        }
-
-        required = required_files.get(stack_id, ["README.md"])
+        required = _REQUIRED_FILES.get(stack_id, ("README.md",))
 
         for req_file in required:
             if req_file not in files:
@@ -77,36 +179,41 @@ class QualityAssurance:
 
     def _validate_python_syntax(self, file_path: str, content: str) -> List[str]:
         """Validate Python syntax."""
-        errors = []
-        try:
-            ast.parse(content)
-        except SyntaxError as e:
-            errors.append(f"Python syntax error in {file_path}: {str(e)}")
-        return errors
+        error = _python_syntax_error(content)
+        if error is None:
+            return []
+        return [f"Python syntax error in {file_path}: {error}"]
 
     def _validate_json_syntax(self, file_path: str, content: str) -> List[str]:
         """Validate JSON syntax."""
         errors = []
         try:
-            import json
             json.loads(content)
         except json.JSONDecodeError as e:
             errors.append(f"JSON syntax error in {file_path}: {str(e)}")
         return errors
 
-    def _check_security(self, files: Dict[str, str]) -> List[str]:
-        """Check for common security issues."""
+    def _check_security(
+        self, files: Dict[str, str], deep_scan: bool = False
+    ) -> List[str]:
+        """Check for common security issues.
+
+        Large or binary files are skipped unless ``deep_scan`` is True.
+        """
         issues = []
 
         for file_path, content in files.items():
-            if file_path in [".env.example", "README.md", "LICENSE"]:
+            if file_path in _SECURITY_SKIP_FILES:
+                continue
+
+            if not deep_scan and (
+                len(content) > _SECURITY_MAX_SCAN_CHARS
+                or "\x00" in content[:_BINARY_SNIFF_CHARS]
+            ):
                 continue
 
-            for pattern, message in self.security_patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    if "example" not in match.group().lower():
-                        issues.append(f"{message} in {file_path}")
+            for message in _security_messages(content):
+                issues.append(f"{message} in {file_path}")
 
         return issues
 
@@ -120,9 +227,9 @@ class QualityAssurance:
 
         readme = files["README.md"]
 
-        required_sections = ["Setup", "Requirements"]
-        for section in required_sections:
-            if section.lower() not in readme.lower():
+        found = {match.lastgroup for match in _README_SECTIONS_RE.finditer(readme)}
+        for section in _README_REQUIRED_SECTIONS:
+            if section not in found:
                 errors.append(f"README missing '{section}' section")
 
         if len(readme) < 100:
@@ -140,44 +247,36 @@ class QualityAssurance:
         Returns:
             Estimated coverage percentage
         """
-        test_files = [f for f in files if "test" in f.lower()]
-        source_files = [
-            f
-            for f in files
-            if f.endswith((".py", ".js", ".ts", ".go"))
-            and "test" not in f.lower()
-            and not f.startswith(".")
-        ]
-
-        if not source_files:
+        test_count = 0
+        source_count = 0
+        for file_path in files:
+            if "test" in file_path.lower():
+                test_count += 1
+            elif file_path.endswith(_SOURCE_EXTENSIONS):
+                if not file_path.startswith("."):
+                    source_count += 1
+
+        if not source_count:
             return 0
 
-        test_ratio = len(test_files) / len(source_files)
+        test_ratio = test_count / source_count
         estimated_coverage = min(int(test_ratio * 100), 100)
 
-        return max(estimated_coverage, 70) if test_files else 0
+        return max(estimated_coverage, 70) if test_count else 0
 
     def count_test_files(self, files: Dict[str, str]) -> int:
         """Count number of test files."""
-        return len([f for f in files if "test" in f.lower()])
+        return sum(1 for file_path in files if "test" in file_path.lower())
 
     def validate_no_placeholders(self, files: Dict[str, str]) -> List[str]:
         """Check for placeholder text that should be replaced."""
         errors = []
-        placeholders = [
-            "TODO",
-            "FIXME",
-            "PLACEHOLDER",
-            "YOUR_",
-            "CHANGE_ME",
-        ]
 
         for file_path, content in files.items():
-            if file_path in [".env.example", "README.md"]:
+            if file_path in _PLACEHOLDER_SKIP_FILES:
                 continue
 
-            for placeholder in placeholders:
-                if placeholder in content:
-                    errors.append(f"Found placeholder '{placeholder}' in {file_path}")
+            for placeholder in _placeholders_found(content):
+                errors.append(f"Found placeholder '{placeholder}' in {file_path}")
 
         return errors
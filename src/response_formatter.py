@@ -2,36 +2,8 @@
 import os
 from typing import Dict, List
 
-
-class ResponseFormatter:
-    """Formats the final response output."""
-
-    def format_response(
-        self,
-        repo_info: Dict,
-        project_info: Dict,
-        stack_id: str,
-        file_count: int,
-        test_count: int,
-        repo_path: str,
-    ) -> str:
-        """
-        Format the final response.
-
-        Args:
-            repo_info: Repository information from GitHub
-            project_info: Project information
-            stack_id: Tech stack identifier
-            file_count: Number of files generated
-            test_count: Number of test files
-            repo_path: Local repository path
-
-        Returns:
-            Formatted response string
-        """
-        tree = self._generate_tree(repo_path)
-
-        response = f"""
+_MAX_TREE_LINES = 50
+_RESPONSE_TEMPLATE = """
 ╔══════════════════════════════════════════════════════════════════════════╗
 ║                    AI CODE GENERATOR - SUCCESS                           ║
 ╚══════════════════════════════════════════════════════════════════════════╝
@@ -39,10 +11,10 @@ class ResponseFormatter:
 📦 Repository Created Successfully!
 
 🔗 Repository Information:
-   - Name: {repo_info['name']}
-   - URL: {repo_info['url']}
-   - Branch: {repo_info['default_branch']}
-   - Clone URL: {repo_info['clone_url']}
+   - Name: {name}
+   - URL: {url}
+   - Branch: {default_branch}
+   - Clone URL: {clone_url}
 
 📊 Project Statistics:
    - Tech Stack: {stack_id}
@@ -56,8 +28,8 @@ class ResponseFormatter:
 🚀 Quick Start:
 
 1. Clone the repository:
-   git clone {repo_info['clone_url']}
-   cd {repo_info['name']}
+   git clone {clone_url}
+   cd {name}
 
 2. Follow setup instructions in README.md
 
@@ -94,7 +66,63 @@ class ResponseFormatter:
 
 Happy coding! 🎉
 """
-        return response
+
+_ERROR_TEMPLATE = """
+╔══════════════════════════════════════════════════════════════════════════╗
+║                    AI CODE GENERATOR - ERROR                             ║
+╚══════════════════════════════════════════════════════════════════════════╝
+
+❌ Error: {error_message}
+"""
+
+_ERROR_SUGGESTIONS = """
+💡 Suggestions:
+   - Check your GitHub token has the required permissions
+   - Verify repository name is valid and not already taken
+   - Ensure all required environment variables are set
+"""
+
+
+class ResponseFormatter:
+    """Formats the final response output."""
+
+    def format_response(
+        self,
+        repo_info: Dict,
+        project_info: Dict,
+        stack_id: str,
+        file_count: int,
+        test_count: int,
+        repo_path: str,
+    ) -> str:
+        """
+        Format the final response.
+
+        Args:
+            repo_info: Repository information from GitHub
+            project_info: Project information
+            stack_id: Tech stack identifier
+            file_count: Number of files generated
+            test_count: Number of test files
+            repo_path: Local repository path
+
+        Returns:
+            Formatted response string
+        """
+        tree = self._generate_tree(repo_path)
+
+        return _RESPONSE_TEMPLATE.format_map(
+            {
+                "name": repo_info["name"],
+                "url": repo_info["url"],
+                "default_branch": repo_info["default_branch"],
+                "clone_url": repo_info["clone_url"],
+                "stack_id": stack_id,
+                "file_count": file_count,
+                "test_count": test_count,
+                "tree": tree,
+            }
+        )
 
     def _generate_tree(self, repo_path: str, max_depth: int = 3) -> str:
         """
@@ -110,31 +138,39 @@ Happy coding! 🎉
         lines = []
 
         def add_tree_lines(path: str, prefix: str = "", depth: int = 0):
-            if depth > max_depth:
+            if depth > max_depth or len(lines) >= _MAX_TREE_LINES:
                 return
 
             try:
-                entries = sorted(os.listdir(path))
+                with os.scandir(path) as it:
+                    entries = sorted(
+                        (e for e in it if not e.name.startswith(".git")),
+                        key=lambda e: e.name,
+                    )
             except PermissionError:
                 return
 
-            entries = [e for e in entries if not e.startswith(".git")]
-
             for i, entry in enumerate(entries):
+                if len(lines) >= _MAX_TREE_LINES:
+                    return
                 is_last = i == len(entries) - 1
                 current_prefix = "└── " if is_last else "├── "
-                lines.append(f"{prefix}{current_prefix}{entry}")
+                lines.append(f"{prefix}{current_prefix}{entry.name}")
+
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
 
-                entry_path = os.path.join(path, entry)
-                if os.path.isdir(entry_path):
+                if is_dir:
                     next_prefix = prefix + ("    " if is_last else "│   ")
-                    add_tree_lines(entry_path, next_prefix, depth + 1)
+                    add_tree_lines(entry.path, next_prefix, depth + 1)
 
         repo_name = os.path.basename(repo_path)
         lines.append(f"{repo_name}/")
         add_tree_lines(repo_path)
 
-        return "\n".join(lines[:50])
+        return "\n".join(lines)
 
     def format_error(self, error_message: str, details: List[str] = None) -> str:
         """
@@ -147,22 +183,12 @@ Happy coding! 🎉
         Returns:
             Formatted error string
         """
-        response = f"""
-╔══════════════════════════════════════════════════════════════════════════╗
-║                    AI CODE GENERATOR - ERROR                             ║
-╚══════════════════════════════════════════════════════════════════════════╝
-
-❌ Error: {error_message}
-"""
+        parts = [_ERROR_TEMPLATE.format_map({"error_message": error_message})]
 
         if details:
-            response += "\n📋 Details:\n"
-            for detail in details:
-                response += f"   - {detail}\n"
+            parts.append("\n📋 Details:\n")
+            parts.extend(f"   - {detail}\n" for detail in details)
 
-        response += "\n💡 Suggestions:\n"
-        response += "   - Check your GitHub token has the required permissions\n"
-        response += "   - Verify repository name is valid and not already taken\n"
-        response += "   - Ensure all required environment variables are set\n"
+        parts.append(_ERROR_SUGGESTIONS)
 
-        return response
+        return "".join(parts)
@@ -1,43 +1,182 @@
 """Tech stack selection logic based on project requirements."""
-from typing import Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Tuple
 
 
-class TechStackSelector:
-    """Intelligently selects appropriate tech stack for projects."""
+def _freeze(value):
+    """Recursively convert dicts and lists to read-only equivalents."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
 
-    def __init__(self):
-        self.stack_templates = {
-            "nodejs-express": {
-                "name": "Node.js + Express",
-                "categories": ["web", "backend", "api"],
-                "files": ["package.json", "src/server.js", "src/routes/"],
+
+def _index_by_category(templates):
+    """Map each category to the stack ids that list it, in template order."""
+    index = {}
+    for stack_id, stack_info in templates.items():
+        for category in stack_info["categories"]:
+            index.setdefault(category, []).append(stack_id)
+    return _freeze(index)
+
+
+_DEPENDENCIES = _freeze(
+    {
+        "nodejs-express": {
+            "runtime": "Node.js 18+",
+            "package_manager": "npm",
+            "dependencies": {
+                "express": "^4.18.2",
+                "dotenv": "^16.3.1",
+                "cors": "^2.8.5",
+                "helmet": "^7.1.0",
+            },
+            "dev_dependencies": {
+                "jest": "^29.7.0",
+                "supertest": "^6.3.3",
+                "eslint": "^8.55.0",
+                "nodemon": "^3.0.2",
+            },
+        },
+        "python-fastapi": {
+            "runtime": "Python 3.9+",
+            "package_manager": "pip",
+            "dependencies": {
+                "fastapi": "0.104.1",
+                "uvicorn": "0.24.0",
+                "pydantic": "2.5.2",
+                "python-dotenv": "1.0.0",
             },
-            "python-fastapi": {
-                "name": "Python + FastAPI",
-                "categories": ["web", "backend", "api"],
-                "files": ["requirements.txt", "src/main.py", "src/api/"],
+            "dev_dependencies": {
+                "pytest": "7.4.3",
+                "pytest-asyncio": "0.21.1",
+                "httpx": "0.25.2",
+                "black": "23.12.1",
+                "pylint": "3.0.3",
             },
-            "react-typescript": {
-                "name": "React + TypeScript",
-                "categories": ["frontend", "web"],
-                "files": ["package.json", "src/App.tsx", "tsconfig.json"],
+        },
+        "react-typescript": {
+            "runtime": "Node.js 18+",
+            "package_manager": "npm",
+            "dependencies": {
+                "react": "^18.2.0",
+                "react-dom": "^18.2.0",
             },
-            "python-cli": {
-                "name": "Python CLI",
-                "categories": ["cli"],
-                "files": ["requirements.txt", "src/cli.py"],
+            "dev_dependencies": {
+                "typescript": "^5.3.3",
+                "vite": "^5.0.7",
+                "@vitejs/plugin-react": "^4.2.1",
+                "@types/react": "^18.2.45",
+                "@types/react-dom": "^18.2.18",
+                "eslint": "^8.55.0",
             },
-            "go-cli": {
-                "name": "Go CLI",
-                "categories": ["cli"],
-                "files": ["go.mod", "main.go"],
+        },
+        "python-cli": {
+            "runtime": "Python 3.9+",
+            "package_manager": "pip",
+            "dependencies": {
+                "click": "8.1.7",
+                "rich": "13.7.0",
             },
-            "python-ml": {
-                "name": "Python ML/Data Science",
-                "categories": ["data"],
-                "files": ["requirements.txt", "src/model.py", "notebooks/"],
+            "dev_dependencies": {
+                "pytest": "7.4.3",
+                "black": "23.12.1",
+                "pylint": "3.0.3",
             },
-        }
+        },
+        "go-cli": {
+            "runtime": "Go 1.21+",
+            "package_manager": "go",
+            "dependencies": {
+                "github.com/spf13/cobra": "v1.8.0",
+            },
+            "dev_dependencies": {},
+        },
+        "python-ml": {
+            "runtime": "Python 3.9+",
+            "package_manager": "pip",
+            "dependencies": {
+                "pandas": "2.1.4",
+                "numpy": "1.26.2",
+                "scikit-learn": "1.3.2",
+                "matplotlib": "3.8.2",
+            },
+            "dev_dependencies": {
+                "pytest": "7.4.3",
+                "jupyter": "1.0.0",
+                "black": "23.12.1",
+            },
+        },
+    }
+)
+
+_STACK_TEMPLATES = _freeze(
+    {
+        "nodejs-express": {
+            "name": "Node.js + Express",
+            "categories": frozenset({"web", "backend", "api"}),
+            "files": ["package.json", "src/server.js", "src/routes/"],
+        },
+        "python-fastapi": {
+            "name": "Python + FastAPI",
+            "categories": frozenset({"web", "backend", "api"}),
+            "files": ["requirements.txt", "src/main.py", "src/api/"],
+        },
+        "react-typescript": {
+            "name": "React + TypeScript",
+            "categories": frozenset({"frontend", "web"}),
+            "files": ["package.json", "src/App.tsx", "tsconfig.json"],
+        },
+        "python-cli": {
+            "name": "Python CLI",
+            "categories": frozenset({"cli"}),
+            "files": ["requirements.txt", "src/cli.py"],
+        },
+        "go-cli": {
+            "name": "Go CLI",
+            "categories": frozenset({"cli"}),
+            "files": ["go.mod", "main.go"],
+        },
+        "python-ml": {
+            "name": "Python ML/Data Science",
+            "categories": frozenset({"data"}),
+            "files": ["requirements.txt", "src/model.py", "notebooks/"],
+        },
+    }
+)
+
+_STACKS_BY_CATEGORY = _index_by_category(_STACK_TEMPLATES)
+
+
+@lru_cache(maxsize=256)
+def _select_stack(keywords: Tuple[str, ...], preferred_stack: Optional[str]) -> str:
+    """Cached implementation of TechStackSelector.select_stack."""
+    if preferred_stack:
+        normalized = preferred_stack.lower().replace(" ", "-").replace("+", "-")
+        if normalized in _STACK_TEMPLATES:
+            return normalized
+        for stack_id in _STACK_TEMPLATES:
+            if normalized in stack_id or stack_id in normalized:
+                return stack_id
+
+    scores = dict.fromkeys(_STACK_TEMPLATES, 0)
+    for keyword in keywords:
+        for stack_id in _STACKS_BY_CATEGORY.get(keyword, ()):
+            scores[stack_id] += 1
+
+    if max(scores.values()) > 0:
+        return max(scores, key=scores.get)
+
+    return "nodejs-express"
+
+
+class TechStackSelector:
+    """Intelligently selects appropriate tech stack for projects."""
+
+    def __init__(self):
+        self.stack_templates = _STACK_TEMPLATES
 
     def select_stack(
         self, keywords: List[str], preferred_stack: Optional[str] = None
@@ -52,119 +191,12 @@ class TechStackSelector:
         Returns:
             Selected tech stack identifier
         """
-        if preferred_stack:
-            normalized = preferred_stack.lower().replace(" ", "-").replace("+", "-")
-            for stack_id in self.stack_templates:
-                if normalized in stack_id or stack_id in normalized:
-                    return stack_id
-
-        scores = {}
-        for stack_id, stack_info in self.stack_templates.items():
-            score = 0
-            for keyword in keywords:
-                if keyword in stack_info["categories"]:
-                    score += 1
-            scores[stack_id] = score
-
-        if max(scores.values()) > 0:
-            return max(scores, key=scores.get)
-
-        return "nodejs-express"
-
-    def get_stack_info(self, stack_id: str) -> Dict:
+        return _select_stack(tuple(keywords), preferred_stack)
+
+    def get_stack_info(self, stack_id: str) -> Mapping:
         """Get detailed information about a tech stack."""
-        return self.stack_templates.get(
-            stack_id, self.stack_templates["nodejs-express"]
-        )
+        return _STACK_TEMPLATES.get(stack_id, _STACK_TEMPLATES["nodejs-express"])
 
-    def get_dependencies(self, stack_id: str) -> Dict:
+    def get_dependencies(self, stack_id: str) -> Mapping:
         """Get dependencies for a specific tech stack."""
-        dependencies = {
-            "nodejs-express": {
-                "runtime": "Node.js 18+",
-                "package_manager": "npm",
-                "dependencies": {
-                    "express": "^4.18.2",
-                    "dotenv": "^16.3.1",
-                    "cors": "^2.8.5",
-                    "helmet": "^7.1.0",
-                },
-                "dev_dependencies": {
-                    "jest": "^29.7.0",
-                    "supertest": "^6.3.3",
-                    "eslint": "^8.55.0",
-                    "nodemon": "^3.0.2",
-                },
-            },
-            "python-fastapi": {
-                "runtime": "Python 3.9+",
-                "package_manager": "pip",
-                "dependencies": {
-                    "fastapi": "0.104.1",
-                    "uvicorn": "0.24.0",
-                    "pydantic": "2.5.2",
-                    "python-dotenv": "1.0.0",
-                },
-                "dev_dependencies": {
-                    "pytest": "7.4.3",
-                    "pytest-asyncio": "0.21.1",
-                    "httpx": "0.25.2",
-                    "black": "23.12.1",
-                    "pylint": "3.0.3",
-                },
-            },
-            "react-typescript": {
-                "runtime": "Node.js 18+",
-                "package_manager": "npm",
-                "dependencies": {
-                    "react": "^18.2.0",
-                    "react-dom": "^18.2.0",
-                },
-                "dev_dependencies": {
-                    "typescript": "^5.3.3",
-                    "vite": "^5.0.7",
-                    "@vitejs/plugin-react": "^4.2.1",
-                    "@types/react": "^18.2.45",
-                    "@types/react-dom": "^18.2.18",
-                    "eslint": "^8.55.0",
-                },
-            },
-            "python-cli": {
-                "runtime": "Python 3.9+",
-                "package_manager": "pip",
-                "dependencies": {
-                    "click": "8.1.7",
-                    "rich": "13.7.0",
-                },
-                "dev_dependencies": {
-                    "pytest": "7.4.3",
-                    "black": "23.12.1",
-                    "pylint": "3.0.3",
-                },
-            },
-            "go-cli": {
-                "runtime": "Go 1.21+",
-                "package_manager": "go",
-                "dependencies": {
-                    "github.com/spf13/cobra": "v1.8.0",
-                },
-                "dev_dependencies": {},
-            },
-            "python-ml": {
-                "runtime": "Python 3.9+",
-                "package_manager": "pip",
-                "dependencies": {
-                    "pandas": "2.1.4",
-                    "numpy": "1.26.2",
-                    "scikit-learn": "1.3.2",
-                    "matplotlib": "3.8.2",
-                },
-                "dev_dependencies": {
-                    "pytest": "7.4.3",
-                    "jupyter": "1.0.0",
-                    "black": "23.12.1",
-                },
-            },
-        }
-
-        return dependencies.get(stack_id, dependencies["nodejs-express"])
+        return _DEPENDENCIES.get(stack_id, _DEPENDENCIES["nodejs-express"])
@@ -0,0 +1,7 @@
+"""Shared pytest configuration."""
+import os
+
+# GitPython raises ImportError at import time when no git executable is found.
+# The git operation tests mock Repo, so let them import without one; tests that
+# need the real binary are skipped via ``requires_git``.
+os.environ.setdefault("GIT_PYTHON_REFRESH", "quiet")
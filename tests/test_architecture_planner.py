@@ -3,16 +3,18 @@ import pytest
 from src.architecture_planner import ArchitecturePlanner
 
 
+@pytest.fixture(scope="class")
+def planner():
+    """Shared ArchitecturePlanner instance for a test class."""
+    return ArchitecturePlanner()
+
+
 class TestArchitecturePlanner:
     """Test cases for ArchitecturePlanner."""
 
-    def setup_method(self):
-        """Setup test fixtures."""
-        self.planner = ArchitecturePlanner()
-
-    def test_plan_architecture_nodejs(self):
+    def test_plan_architecture_nodejs(self, planner):
         """Test architecture planning for Node.js."""
-        architecture = self.planner.plan_architecture(
+        architecture = planner.plan_architecture(
             "nodejs-express", ["user management"], "Build a REST API"
         )
 
@@ -22,29 +24,34 @@ class TestArchitecturePlanner:
         assert "tests" in architecture["directories"]
         assert ".github/workflows/ci.yml" in architecture["files"]
 
-    def test_plan_architecture_python_fastapi(self):
+    def test_plan_architecture_python_fastapi(self, planner):
         """Test architecture planning for Python FastAPI."""
-        architecture = self.planner.plan_architecture(
-            "python-fastapi", [], "Build an API"
-        )
+        architecture = planner.plan_architecture("python-fastapi", [], "Build an API")
 
         assert "src" in architecture["directories"]
         assert "src/main.py" in architecture["files"]
         assert "tests" in architecture["directories"]
 
-    def test_plan_architecture_includes_ci_workflow(self):
+    def test_plan_architecture_includes_ci_workflow(self, planner):
         """Test that architecture includes CI/CD workflow."""
-        architecture = self.planner.plan_architecture(
-            "nodejs-express", [], "Test project"
-        )
+        architecture = planner.plan_architecture("nodejs-express", [], "Test project")
 
         assert ".github" in architecture["directories"]
         assert ".github/workflows" in architecture["directories"]
         assert ".github/workflows/ci.yml" in architecture["files"]
 
-    def test_generate_api_design_basic(self):
+    def test_plan_architecture_does_not_mutate_base_structure(self, planner):
+        """Test that repeated planning returns independent structures."""
+        first = planner.plan_architecture("python-cli", [], "Build a CLI")
+        second = planner.plan_architecture("python-cli", [], "Build a CLI")
+
+        assert first["files"] == second["files"]
+        assert first["files"] is not second["files"]
+        assert second["directories"].count(".github") == 1
+
+    def test_generate_api_design_basic(self, planner):
         """Test basic API design generation."""
-        api_design = self.planner.generate_api_design([])
+        api_design = planner.generate_api_design([])
 
         assert "endpoints" in api_design
         assert len(api_design["endpoints"]) > 0
@@ -53,18 +60,18 @@ class TestArchitecturePlanner:
         assert health_endpoint["method"] == "GET"
         assert health_endpoint["path"] == "/health"
 
-    def test_generate_api_design_with_user_feature(self):
+    def test_generate_api_design_with_user_feature(self, planner):
         """Test API design with user features."""
-        api_design = self.planner.generate_api_design(["user authentication"])
+        api_design = planner.generate_api_design(["user authentication"])
 
         endpoints = api_design["endpoints"]
         paths = [ep["path"] for ep in endpoints]
 
         assert any("/api/users" in path for path in paths)
 
-    def test_generate_api_design_with_product_feature(self):
+    def test_generate_api_design_with_product_feature(self, planner):
         """Test API design with product features."""
-        api_design = self.planner.generate_api_design(["product management"])
+        api_design = planner.generate_api_design(["product management"])
 
         endpoints = api_design["endpoints"]
         paths = [ep["path"] for ep in endpoints]
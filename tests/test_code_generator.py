@@ -1,125 +1,132 @@
 """Tests for code generator module."""
+from types import MappingProxyType
+
 import pytest
 from src.code_generator import CodeGenerator
+from src.tech_stack_selector import TechStackSelector
+
+PROJECT_INFO = MappingProxyType(
+    {
+        "repo_name": "test-project",
+        "repo_description": "Test project",
+        "license": "MIT",
+    }
+)
+EMPTY_DEPENDENCIES = MappingProxyType(
+    {"dependencies": MappingProxyType({}), "dev_dependencies": MappingProxyType({})}
+)
+REQUIRED_PROJECT_FILES = frozenset(
+    {".gitignore", ".env.example", "LICENSE", "README.md", ".github/workflows/ci.yml"}
+)
+
+
+@pytest.fixture(scope="class")
+def generator():
+    """Shared CodeGenerator instance for a test class."""
+    return CodeGenerator()
 
 
 class TestCodeGenerator:
     """Test cases for CodeGenerator."""
 
-    def setup_method(self):
-        """Setup test fixtures."""
-        self.generator = CodeGenerator()
-
-    def test_generate_nodejs_express_project(self):
-        """Test Node.js Express project generation."""
-        project_info = {
-            "repo_name": "test-api",
-            "repo_description": "Test API",
-            "license": "MIT",
-        }
-        dependencies = {
-            "dependencies": {"express": "^4.18.2"},
-            "dev_dependencies": {"jest": "^29.7.0"},
-        }
-
-        files = self.generator._generate_nodejs_express(project_info, dependencies)
-
-        assert "package.json" in files
-        assert "src/app.js" in files
-        assert "src/server.js" in files
-        assert "tests/unit/health.test.js" in files
-        assert "express" in files["package.json"]
-
-    def test_generate_python_fastapi_project(self):
-        """Test Python FastAPI project generation."""
-        project_info = {
-            "repo_name": "test-api",
-            "repo_description": "Test API",
-            "license": "MIT",
-        }
-        dependencies = {
-            "dependencies": {"fastapi": "0.104.1"},
-            "dev_dependencies": {"pytest": "7.4.3"},
-        }
-
-        files = self.generator._generate_python_fastapi(project_info, dependencies)
-
-        assert "requirements.txt" in files
-        assert "src/main.py" in files
-        assert "src/api/routes/health.py" in files
-        assert "tests/test_health.py" in files
-
-    def test_generate_react_typescript_project(self):
-        """Test React TypeScript project generation."""
-        project_info = {
-            "repo_name": "test-app",
-            "repo_description": "Test App",
-            "license": "MIT",
-        }
-        dependencies = {
-            "dependencies": {"react": "^18.2.0"},
-            "dev_dependencies": {"typescript": "^5.3.3"},
-        }
-
-        files = self.generator._generate_react_typescript(project_info, dependencies)
-
-        assert "package.json" in files
-        assert "src/App.tsx" in files
-        assert "tsconfig.json" in files
-        assert "index.html" in files
-
-    def test_generate_python_cli_project(self):
-        """Test Python CLI project generation."""
-        project_info = {
-            "repo_name": "test-cli",
-            "repo_description": "Test CLI",
-            "license": "MIT",
-        }
-        dependencies = {
-            "dependencies": {"click": "8.1.7"},
-            "dev_dependencies": {"pytest": "7.4.3"},
-        }
-
-        files = self.generator._generate_python_cli(project_info, dependencies)
-
-        assert "requirements.txt" in files
-        assert "src/cli.py" in files
-        assert "setup.py" in files
-        assert "tests/test_cli.py" in files
-
-    def test_generate_gitignore_nodejs(self):
-        """Test .gitignore generation for Node.js."""
-        gitignore = self.generator._generate_gitignore("nodejs-express")
-
-        assert "node_modules/" in gitignore
-        assert ".env" in gitignore
-
-    def test_generate_gitignore_python(self):
-        """Test .gitignore generation for Python."""
-        gitignore = self.generator._generate_gitignore("python-fastapi")
-
-        assert "__pycache__/" in gitignore
-        assert "venv/" in gitignore
-
-    def test_generate_license(self):
+    @pytest.mark.parametrize(
+        "method,dependencies,expected_files",
+        [
+            (
+                "_generate_nodejs_express",
+                {
+                    "dependencies": {"express": "^4.18.2"},
+                    "dev_dependencies": {"jest": "^29.7.0"},
+                },
+                {
+                    "package.json",
+                    "src/app.js",
+                    "src/server.js",
+                    "tests/unit/health.test.js",
+                },
+            ),
+            (
+                "_generate_python_fastapi",
+                {
+                    "dependencies": {"fastapi": "0.104.1"},
+                    "dev_dependencies": {"pytest": "7.4.3"},
+                },
+                {
+                    "requirements.txt",
+                    "src/main.py",
+                    "src/api/routes/health.py",
+                    "tests/test_health.py",
+                },
+            ),
+            (
+                "_generate_react_typescript",
+                {
+                    "dependencies": {"react": "^18.2.0"},
+                    "dev_dependencies": {"typescript": "^5.3.3"},
+                },
+                {"package.json", "src/App.tsx", "tsconfig.json", "index.html"},
+            ),
+            (
+                "_generate_python_cli",
+                {
+                    "dependencies": {"click": "8.1.7"},
+                    "dev_dependencies": {"pytest": "7.4.3"},
+                },
+                {"requirements.txt", "src/cli.py", "setup.py", "tests/test_cli.py"},
+            ),
+        ],
+    )
+    def test_generate_stack_project(
+        self, generator, method, dependencies, expected_files
+    ):
+        """Test per-stack project generation."""
+        files = getattr(generator, method)(PROJECT_INFO, dependencies)
+
+        assert expected_files <= set(files)
+
+    def test_generate_package_json_from_selector_dependencies(self, generator):
+        """Test package.json serialization of shared read-only dependencies."""
+        dependencies = TechStackSelector().get_dependencies("nodejs-express")
+
+        files = generator._generate_nodejs_express(PROJECT_INFO, dependencies)
+
+        assert '"express": "^4.18.2"' in files["package.json"]
+
+    @pytest.mark.parametrize(
+        "stack_id,must_contain",
+        [
+            ("nodejs-express", ["node_modules/", ".env"]),
+            ("python-fastapi", ["__pycache__/", "venv/"]),
+        ],
+    )
+    def test_generate_gitignore(self, generator, stack_id, must_contain):
+        """Test .gitignore generation per stack."""
+        gitignore = generator._generate_gitignore(stack_id)
+
+        for entry in must_contain:
+            assert entry in gitignore
+
+    def test_json_dumps_rejects_non_mapping_objects(self, generator):
+        """Test that only mappings get special JSON handling."""
+        assert generator._json_dumps({"a": MappingProxyType({"b": 1})}) == (
+            '{\n  "a": {\n    "b": 1\n  }\n}'
+        )
+        with pytest.raises(TypeError, match="Object of type set is not JSON"):
+            generator._json_dumps({"a": {1}})
+
+    def test_generate_license(self, generator):
         """Test LICENSE generation."""
-        project_info = {"license": "MIT"}
-        license_text = self.generator._generate_license(project_info)
+        license_text = generator._generate_license(PROJECT_INFO)
 
         assert "MIT License" in license_text
         assert "Permission is hereby granted" in license_text
 
-    def test_generate_readme(self):
+    def test_generate_readme(self, generator):
         """Test README generation."""
-        project_info = {
-            "repo_name": "test-project",
-            "repo_description": "Test project",
-            "license": "MIT",
-        }
         dependencies = {"runtime": "Node.js 18+"}
 
-        readme = self.generator._generate_readme(
-            "nodejs-express", project_info, dependencies
+        readme = generator._generate_readme(
+            "nodejs-express", PROJECT_INFO, dependencies
         )
 
         assert "# test-project" in readme
@@ -127,38 +134,26 @@ class TestCodeGenerator:
         assert "Setup" in readme
         assert "Testing" in readme
 
-    def test_generate_ci_workflow_nodejs(self):
-        """Test CI workflow generation for Node.js."""
-        workflow = self.generator._generate_ci_workflow("nodejs-express")
-
-        assert "name: CI" in workflow
-        assert "setup-node@v3" in workflow
-        assert "npm ci" in workflow
-
-    def test_generate_ci_workflow_python(self):
-        """Test CI workflow generation for Python."""
-        workflow = self.generator._generate_ci_workflow("python-fastapi")
-
-        assert "name: CI" in workflow
-        assert "setup-python@v4" in workflow
-        assert "pytest" in workflow
-
-    def test_generate_project_includes_all_required_files(self):
+    @pytest.mark.parametrize(
+        "stack_id,must_contain",
+        [
+            ("nodejs-express", ["name: CI", "setup-node@v3", "npm ci"]),
+            ("python-fastapi", ["name: CI", "setup-python@v4", "pytest"]),
+        ],
+    )
+    def test_generate_ci_workflow(self, generator, stack_id, must_contain):
+        """Test CI workflow generation per stack."""
+        workflow = generator._generate_ci_workflow(stack_id)
+
+        for entry in must_contain:
+            assert entry in workflow
+
+    def test_generate_project_includes_all_required_files(self, generator):
         """Test that generate_project includes all required files."""
-        project_info = {
-            "repo_name": "test-project",
-            "repo_description": "Test",
-            "license": "MIT",
-        }
         architecture = {"files": []}
-        dependencies = {"dependencies": {}, "dev_dependencies": {}}
 
-        files = self.generator.generate_project(
-            "nodejs-express", architecture, project_info, dependencies
+        files = generator.generate_project(
+            "nodejs-express", architecture, PROJECT_INFO, EMPTY_DEPENDENCIES
         )
 
-        assert ".gitignore" in files
-        assert ".env.example" in files
-        assert "LICENSE" in files
-        assert "README.md" in files
-        assert ".github/workflows/ci.yml" in files
+        assert REQUIRED_PROJECT_FILES.issubset(files)
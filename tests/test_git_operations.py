@@ -1,76 +1,99 @@
 """Tests for git operations module."""
 import pytest
-import tempfile
 import os
+import shutil
+from unittest.mock import patch
+from git import Repo
 from src.git_operations import GitOperations
 
+requires_git = pytest.mark.skipif(
+    shutil.which("git") is None, reason="git executable not available"
+)
+
+
+@pytest.fixture(scope="class")
+def git_ops(tmp_path_factory):
+    """Shared GitOperations rooted in a per-class temporary directory."""
+    return GitOperations(base_dir=str(tmp_path_factory.mktemp("git_base")))
+
 
 class TestGitOperations:
     """Test cases for GitOperations."""
 
-    def test_initialize_repository(self):
+    def test_initialize_repository(self, git_ops, request):
         """Test repository initialization."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            git_ops = GitOperations(base_dir=tmpdir)
-            repo_path = git_ops.initialize_repository("test-repo")
+        with patch("src.git_operations.Repo") as mock_repo:
+            repo_path = git_ops.initialize_repository(request.node.name)
 
-            assert os.path.exists(repo_path)
-            assert os.path.exists(os.path.join(repo_path, ".git"))
+        assert os.path.isdir(repo_path)
+        mock_repo.init.assert_called_once_with(repo_path)
 
-    def test_create_project_structure(self):
+    def test_create_project_structure(self, git_ops, request):
         """Test creating project files and directories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            git_ops = GitOperations(base_dir=tmpdir)
-            repo_path = git_ops.initialize_repository("test-repo")
+        repo_path = os.path.join(git_ops.base_dir, request.node.name)
 
-            files = {
-                "README.md": "# Test Project",
-                "src/main.py": "print('hello')",
-                "tests/test_main.py": "def test(): pass",
-            }
+        files = {
+            "README.md": "# Test Project",
+            "src/main.py": "print('hello')",
+            "tests/test_main.py": "def test(): pass",
+        }
 
-            git_ops.create_project_structure(repo_path, files)
+        git_ops.create_project_structure(repo_path, files)
 
-            assert os.path.exists(os.path.join(repo_path, "README.md"))
-            assert os.path.exists(os.path.join(repo_path, "src", "main.py"))
-            assert os.path.exists(os.path.join(repo_path, "tests", "test_main.py"))
+        found = {
+            os.path.relpath(os.path.join(root, name), repo_path).replace(os.sep, "/")
+            for root, _, names in os.walk(repo_path)
+            for name in names
+        }
+        assert set(files) <= found
 
-            with open(os.path.join(repo_path, "README.md")) as f:
-                assert f.read() == "# Test Project"
+        with open(os.path.join(repo_path, "README.md")) as f:
+            assert f.read() == "# Test Project"
 
-    def test_commit_files(self):
+    def test_commit_files(self, git_ops, request):
         """Test committing files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            git_ops = GitOperations(base_dir=tmpdir)
-            repo_path = git_ops.initialize_repository("test-repo")
+        repo_path = os.path.join(git_ops.base_dir, request.node.name)
 
-            files = {"README.md": "# Test"}
-            git_ops.create_project_structure(repo_path, files)
+        with patch("src.git_operations.Repo") as mock_repo:
             git_ops.commit_files(repo_path, "Initial commit")
 
-    def test_get_file_count(self):
+        repo = mock_repo.return_value
+        repo.git.add.assert_called_once_with(A=True)
+        repo.index.commit.assert_called_once_with("Initial commit")
+
+    def test_get_file_count(self, git_ops, request):
         """Test counting files in repository."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            git_ops = GitOperations(base_dir=tmpdir)
-            repo_path = git_ops.initialize_repository("test-repo")
+        repo_path = os.path.join(git_ops.base_dir, request.node.name)
 
-            files = {
-                "README.md": "# Test",
-                "src/main.py": "print('hello')",
-                "tests/test_main.py": "def test(): pass",
-            }
-            git_ops.create_project_structure(repo_path, files)
+        files = {
+            "README.md": "# Test",
+            "src/main.py": "print('hello')",
+            "tests/test_main.py": "def test(): pass",
+            ".git/HEAD": "ref: refs/heads/main",
+        }
+        git_ops.create_project_structure(repo_path, files)
 
-            count = git_ops.get_file_count(repo_path)
-            assert count == 3
+        count = git_ops.get_file_count(repo_path)
+        assert count == 3
 
-    def test_cleanup(self):
+    def test_cleanup(self, tmp_path):
         """Test repository cleanup."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            git_ops = GitOperations(base_dir=tmpdir)
+        git_ops = GitOperations(base_dir=str(tmp_path))
+        with patch("src.git_operations.Repo"):
             repo_path = git_ops.initialize_repository("test-repo")
 
-            assert os.path.exists(repo_path)
-            
-            git_ops.cleanup(repo_path)
-            assert not os.path.exists(repo_path)
+        assert os.path.exists(repo_path)
+
+        git_ops.cleanup(repo_path)
+        assert not os.path.exists(repo_path)
+
+    @pytest.mark.slow
+    @requires_git
+    def test_initialize_and_commit_with_git(self, git_ops, request):
+        """Test initializing and committing against a real git repository."""
+        repo_path = git_ops.initialize_repository(request.node.name)
+        git_ops.create_project_structure(repo_path, {"README.md": "# Test"})
+        git_ops.commit_files(repo_path, "Initial commit")
+
+        assert os.path.exists(os.path.join(repo_path, ".git"))
+        assert Repo(repo_path).head.commit.message == "Initial commit"
@@ -3,16 +3,18 @@ import pytest
 from src.input_processor import InputProcessor
 
 
+@pytest.fixture(scope="class")
+def processor():
+    """Shared InputProcessor instance for a test class."""
+    return InputProcessor()
+
+
 class TestInputProcessor:
     """Test cases for InputProcessor."""
 
-    def setup_method(self):
-        """Setup test fixtures."""
-        self.processor = InputProcessor()
-
-    def test_process_input_basic(self):
+    def test_process_input_basic(self, processor):
         """Test basic input processing."""
-        result = self.processor.process_input(
+        result = processor.process_input(
             description="Build a web API",
             repo_name="test-api",
         )
@@ -22,62 +24,62 @@ class TestInputProcessor:
         assert result["license"] == "MIT"
         assert result["is_private"] is False
 
-    def test_process_input_with_features(self):
+    def test_process_input_with_features(self, processor):
         """Test input processing with features."""
         features = ["user authentication", "data validation"]
-        result = self.processor.process_input(
+        result = processor.process_input(
             description="Build a web API", features=features
         )
 
         assert result["features"] == features
 
-    def test_process_input_empty_description(self):
+    def test_process_input_empty_description(self, processor):
         """Test that empty description raises error."""
         with pytest.raises(ValueError, match="Project description is required"):
-            self.processor.process_input(description="")
+            processor.process_input(description="")
 
-    def test_generate_repo_name_from_description(self):
+    def test_generate_repo_name_from_description(self, processor):
         """Test automatic repo name generation."""
-        result = self.processor.process_input(
+        result = processor.process_input(
             description="Build a todo list application"
         )
 
         assert result["repo_name"] == "build-a-todo"
 
-    def test_sanitize_repo_name(self):
+    def test_sanitize_repo_name(self, processor):
         """Test repository name sanitization."""
-        sanitized = self.processor._sanitize_repo_name("My Project! @#$%")
+        sanitized = processor._sanitize_repo_name("My Project! @#$%")
         assert sanitized == "My-Project"
 
-    def test_validate_repo_name_invalid_chars(self):
+    def test_validate_repo_name_invalid_chars(self, processor):
         """Test repo name validation with invalid characters."""
         with pytest.raises(ValueError, match="can only contain"):
-            self.processor._validate_repo_name("repo@name#invalid")
+            processor._validate_repo_name("repo@name#invalid")
 
-    def test_extract_keywords_web(self):
+    def test_extract_keywords_web(self, processor):
         """Test keyword extraction for web projects."""
-        keywords = self.processor.extract_keywords(
+        keywords = processor.extract_keywords(
             "Build a REST API web service with database"
         )
 
         assert "web" in keywords
         assert "backend" in keywords
 
-    def test_extract_keywords_mobile(self):
+    def test_extract_keywords_mobile(self, processor):
         """Test keyword extraction for mobile projects."""
-        keywords = self.processor.extract_keywords("Create a mobile app for iOS and Android")
+        keywords = processor.extract_keywords("Create a mobile app for iOS and Android")
 
         assert "mobile" in keywords
 
-    def test_extract_keywords_cli(self):
+    def test_extract_keywords_cli(self, processor):
         """Test keyword extraction for CLI projects."""
-        keywords = self.processor.extract_keywords("Build a command-line tool")
+        keywords = processor.extract_keywords("Build a command-line tool")
 
         assert "cli" in keywords
 
-    def test_invalid_license_defaults_to_mit(self):
+    def test_invalid_license_defaults_to_mit(self, processor):
         """Test that invalid license defaults to MIT."""
-        result = self.processor.process_input(
+        result = processor.process_input(
             description="Test project", license_type="INVALID"
         )
 
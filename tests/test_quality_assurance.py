@@ -1,6 +1,10 @@
 """Tests for quality assurance module."""
 import pytest
-from src.quality_assurance import QualityAssurance
+from src.quality_assurance import (
+    QualityAssurance,
+    _cached_scan_python_syntax,
+    _cached_scan_security,
+)
 
 
 class TestQualityAssurance:
@@ -25,6 +29,31 @@ class TestQualityAssurance:
         assert len(errors) > 0
         assert "syntax error" in errors[0].lower()
 
+    def test_validate_python_syntax_cached_by_content(self):
+        """Test that identical Python sources are only parsed once."""
+        code = "VALUE = 'cached'\n"
+        self.qa._validate_python_syntax("a.py", code)
+        hits = _cached_scan_python_syntax.cache_info().hits
+
+        errors = self.qa._validate_python_syntax("b.py", code)
+
+        assert errors == []
+        assert _cached_scan_python_syntax.cache_info().hits == hits + 1
+
+    def test_validate_python_syntax_large_file_not_cached(self):
+        """Test that oversized Python sources are parsed without being cached."""
+        _cached_scan_python_syntax.cache_clear()
+        code = "VALUE = 1\n" + "#" * (1 << 20)
+
+        errors = self.qa._validate_python_syntax("big.py", code)
+
+        assert errors == []
+        assert _cached_scan_python_syntax.cache_info().currsize == 0
+
+    def test_validate_python_syntax_empty(self):
+        """Test that empty Python files are valid."""
+        assert self.qa._validate_python_syntax("__init__.py", "") == []
+
     def test_validate_json_syntax_valid(self):
         """Test valid JSON syntax validation."""
         json_str = '{"name": "test", "version": "1.0.0"}'
@@ -39,6 +68,13 @@ class TestQualityAssurance:
 
         assert len(errors) > 0
 
+    def test_validate_json_syntax_accepts_stdlib_extensions(self):
+        """Test that JSON validity follows the stdlib json module."""
+        json_str = '{"a": NaN, "b": Infinity, "c": 1e400}'
+        errors = self.qa._validate_json_syntax("data.json", json_str)
+
+        assert errors == []
+
     def test_check_security_hardcoded_password(self):
         """Test detection of hardcoded passwords."""
         files = {"config.py": "password = 'secret123'"}
@@ -55,6 +91,50 @@ class TestQualityAssurance:
         assert len(issues) > 0
         assert any("api key" in issue.lower() for issue in issues)
 
+    def test_check_security_reports_each_secret_kind(self):
+        """Test that every secret kind is labelled in rule order."""
+        files = {"config.py": "secret = 'abc'\ntoken = 'def'\npassword = 'example'"}
+        issues = self.qa._check_security(files)
+
+        assert issues == [
+            "Hardcoded secret detected in config.py",
+            "Hardcoded token detected in config.py",
+        ]
+
+    def test_check_security_reports_nested_secrets(self):
+        """Test that a secret inside another rule's match is still reported."""
+        files = {"config.py": "password = \"token = 'abc'\""}
+        issues = self.qa._check_security(files)
+
+        assert issues == [
+            "Hardcoded password detected in config.py",
+            "Hardcoded token detected in config.py",
+        ]
+
+    def test_check_security_unicode_whitespace(self):
+        """Test that non-breaking spaces around '=' do not hide a secret."""
+        files = {"config.js": 'const password\u00a0=\u00a0"hunter2";'}
+        issues = self.qa._check_security(files)
+
+        assert issues == ["Hardcoded password detected in config.js"]
+
+    def test_check_security_unicode_case_folding(self):
+        """Test that Unicode letters folding onto ASCII keywords are detected."""
+        files = {"config.py": 'ſecret = "abc"\napı_key = "def"'}
+        issues = self.qa._check_security(files)
+
+        assert issues == [
+            "Hardcoded API key detected in config.py",
+            "Hardcoded secret detected in config.py",
+        ]
+
+    def test_check_security_clean_file(self):
+        """Test that files without secret keywords produce no issues."""
+        files = {"src/main.py": "def main():\n    return 42\n"}
+        issues = self.qa._check_security(files)
+
+        assert issues == []
+
     def test_check_security_env_example_ignored(self):
         """Test that .env.example is ignored in security checks."""
         files = {".env.example": "API_KEY=your_api_key_here"}
@@ -62,6 +142,42 @@ class TestQualityAssurance:
 
         assert len(issues) == 0
 
+    def test_check_security_skips_binary_and_large_files(self):
+        """Test that binary and oversized files are only scanned on deep scan."""
+        secret = 'password = "secret123"\n'
+        files = {
+            "assets/blob.bin": "\x00" + secret,
+            "dist/bundle.js": secret + "x" * (1 << 20),
+        }
+
+        assert self.qa._check_security(files) == []
+        assert len(self.qa._check_security(files, deep_scan=True)) == 2
+
+    def test_check_security_duplicate_contents_scanned_once(self):
+        """Test that identical file contents are scanned once but reported per file."""
+        _cached_scan_security.cache_clear()
+        content = 'token = "duplicated-token"\n'
+        files = {"a/config.py": content, "b/config.py": content}
+
+        issues = self.qa._check_security(files)
+
+        assert issues == [
+            "Hardcoded token detected in a/config.py",
+            "Hardcoded token detected in b/config.py",
+        ]
+        info = _cached_scan_security.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_check_security_deep_scan_skips_cache_for_large_files(self):
+        """Test that oversized contents are scanned without being cached."""
+        _cached_scan_security.cache_clear()
+        files = {"dist/bundle.js": 'token = "abc"\n' + "x" * (1 << 20)}
+
+        issues = self.qa._check_security(files, deep_scan=True)
+
+        assert issues == ["Hardcoded token detected in dist/bundle.js"]
+        assert _cached_scan_security.cache_info().currsize == 0
+
     def test_validate_readme_complete(self):
         """Test README validation with complete content."""
         files = {
@@ -97,6 +213,13 @@ class TestQualityAssurance:
 
         assert len(errors) > 0
 
+    def test_validate_readme_missing_section(self):
+        """Test that each missing README section is reported by name."""
+        files = {"README.md": "# Project\n\n## SETUP\n\n" + "Run the installer. " * 10}
+        errors = self.qa._validate_readme(files)
+
+        assert errors == ["README missing 'Requirements' section"]
+
     def test_estimate_test_coverage(self):
         """Test test coverage estimation."""
         files = {
@@ -76,3 +76,26 @@ class TestResponseFormatter:
             assert "README.md" in tree
             assert "src" in tree
             assert "tests" in tree
+
+    def test_generate_tree_truncated(self):
+        """Test that large trees are capped at 50 lines."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(60):
+                with open(os.path.join(tmpdir, f"file_{i:02d}.txt"), "w") as f:
+                    f.write("x")
+
+            tree = self.formatter._generate_tree(tmpdir)
+
+            lines = tree.split("\n")
+            assert len(lines) == 50
+            assert lines[-1].endswith("file_48.txt")
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks not supported")
+    def test_generate_tree_unreadable_symlink(self):
+        """Test that a symlink that cannot be stat'ed is listed as a file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.symlink("loop", os.path.join(tmpdir, "loop"))
+
+            tree = self.formatter._generate_tree(tmpdir)
+
+            assert tree.split("\n")[-1] == "└── loop"
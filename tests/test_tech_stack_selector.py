@@ -1,6 +1,6 @@
 """Tests for tech stack selector module."""
 import pytest
-from src.tech_stack_selector import TechStackSelector
+from src.tech_stack_selector import TechStackSelector, _select_stack
 
 
 class TestTechStackSelector:
@@ -52,6 +52,22 @@ class TestTechStackSelector:
 
         assert stack_id == "nodejs-express"
 
+    def test_select_stack_cached(self):
+        """Test that repeated selections are served from the cache."""
+        self.selector.select_stack(["devops", "data"], preferred_stack=None)
+        hits = _select_stack.cache_info().hits
+
+        stack_id = self.selector.select_stack(["devops", "data"])
+
+        assert stack_id == "python-ml"
+        assert _select_stack.cache_info().hits == hits + 1
+
+    def test_select_stack_counts_repeated_keywords(self):
+        """Test that repeated keywords still weigh into the score."""
+        stack_id = self.selector.select_stack(["backend", "frontend", "frontend"])
+
+        assert stack_id == "react-typescript"
+
     def test_get_stack_info(self):
         """Test getting stack information."""
         info = self.selector.get_stack_info("nodejs-express")
@@ -59,6 +75,14 @@ class TestTechStackSelector:
         assert info["name"] == "Node.js + Express"
         assert "web" in info["categories"]
 
+    def test_get_stack_info_is_shared_and_read_only(self):
+        """Test that stack info is shared across selectors and immutable."""
+        info = self.selector.get_stack_info("go-cli")
+
+        assert info is TechStackSelector().get_stack_info("go-cli")
+        with pytest.raises(TypeError):
+            info["name"] = "Rust CLI"
+
     def test_get_dependencies_nodejs(self):
         """Test getting Node.js dependencies."""
         deps = self.selector.get_dependencies("nodejs-express")
@@ -74,6 +98,14 @@ class TestTechStackSelector:
         assert "fastapi" in deps["dependencies"]
         assert "pytest" in deps["dev_dependencies"]
 
+    def test_get_dependencies_is_shared_and_read_only(self):
+        """Test that dependencies are built once and cannot be mutated."""
+        deps = self.selector.get_dependencies("python-cli")
+
+        assert deps is TechStackSelector().get_dependencies("python-cli")
+        with pytest.raises(TypeError):
+            deps["dependencies"]["click"] = "0.0.0"
+
     def test_preferred_stack_normalization(self):
         """Test that preferred stack is normalized correctly."""
         stack_id = self.selector.select_stack([], preferred_stack="Node.js + Express")